@@ -3,7 +3,7 @@
 NetApp Volume Migration Script
 
 This script safely moves volumes between nodes in a NetApp cluster with progress tracking
-and limits concurrent volume moves to 4 at a time.
+and limits concurrent volume moves (16 at a time by default).
 
 Requirements:
 - netapp-ontap Python package (pip install netapp-ontap)
@@ -12,32 +12,61 @@ Requirements:
 """
 
 import argparse
+import atexit
+import itertools
 import logging
+import logging.handlers
+import queue
+import re
 import sys
 import time
 import threading
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from datetime import datetime
-# import paramiko
+import paramiko
 from netapp_ontap import config, HostConnection, NetAppRestError
 from netapp_ontap.resources import Volume, Job, Node
-import os
-import subprocess
+import socket
 
 # Define constants for connection settings
 class C:
     NETAPP_API_CONNECTION_TIMEOUT = 30
     NETAPP_API_READ_TIMEOUT = 60
     NETAPP_API_RETRY_API_BACKOFF_FACTOR = 0.5
-
-# Configure logging
+    SSH_CONNECT_TIMEOUT = 30
+    SSH_COMMAND_TIMEOUT = 120  # 2 minute timeout per CLI command
+    MOVE_POLL_MIN_INTERVAL = 2  # First status poll after a start or progress change
+    MOVE_POLL_MAX_INTERVAL = 60  # Backoff ceiling while progress is unchanged
+    MOVE_STATUS_CACHE_TTL = 5  # Seconds a worker-fetched job status is reused by the status reporter
+    DEFAULT_MAX_CONCURRENT = 16  # Cluster-side volume moves running at once
+    UNKNOWN_JOB_ID = "CLI_JOB"  # Started move whose job ID was not reported; tracked by volume instead
+    REST_THROTTLE_STATUS_CODES = (429, 503)  # Cluster is overloaded; back off instead of failing
+    REST_THROTTLE_RETRIES = 5
+    REST_THROTTLE_MAX_BACKOFF = 60
+
+# Matches the job ID in 'volume move start' output ("Job ID: 1234", "job-id 1234" or "[Job 1234] Job is queued")
+JOB_ID_RE = re.compile(r'(?:Job ID:|job-id|\[Job)\s*(\d+)', re.IGNORECASE)
+
+# Matches a CLI error line, including one behind a prompt ("c::> Error: command failed: ...")
+CLI_ERROR_RE = re.compile(r'\berror:', re.IGNORECASE)
+
+# Configure logging; worker threads only enqueue records and a single
+# listener thread writes them to the file and console
+log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+log_handlers = [
+    logging.FileHandler("volume_migration.log"),
+    logging.StreamHandler(sys.stdout)
+]
+for log_handler in log_handlers:
+    log_handler.setFormatter(log_formatter)
+log_queue = queue.Queue(-1)
+log_listener = logging.handlers.QueueListener(log_queue, *log_handlers)
+log_listener.start()
+atexit.register(log_listener.stop)  # Drain queued records before exit
 logging.basicConfig(
     level=logging.DEBUG,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("volume_migration.log"),
-        logging.StreamHandler(sys.stdout)
-    ]
+    format='%(message)s',  # Timestamp and level are added by the listener's handlers
+    handlers=[logging.handlers.QueueHandler(log_queue)]
 )
 logger = logging.getLogger(__name__)
 
@@ -51,28 +80,67 @@ def connect(method):
 
     Hence, this decorator will be applied to each class method, as applicable,
     allowing it to automatically reconnect regardless of what instances may exist
-    at the time.
+    at the time. The connection is only rebuilt when another cluster/user has
+    taken over the global, so repeated calls keep reusing the same HTTP session.
     '''
     def insertConnection(self, *args, **kwargs):
         '''
         Insert Connection
 
-        Inner function for decorator to forcefully set the connection to the
-        instance's NetApp.
+        Inner function for decorator to set the connection to the instance's
+        NetApp if it is not already the active one.
         '''
-        config.CONNECTION = HostConnection(
-            host=self.cluster,
-            username=self.username,
-            password=self.password,
-            verify=self.verify_ssl
-        )
-        config.CONNECTION.protocol_timeouts = (C.NETAPP_API_CONNECTION_TIMEOUT,
-                                             C.NETAPP_API_READ_TIMEOUT)
-        config.RETRY_API_BACKOFF_FACTOR = C.NETAPP_API_RETRY_API_BACKOFF_FACTOR
+        key = (self.cluster, self.username)
+        if getattr(config.CONNECTION, '_vm_key', None) != key:
+            connection = HostConnection(
+                host=self.cluster,
+                username=self.username,
+                password=self.password,
+                verify=self.verify_ssl
+            )
+            connection.protocol_timeouts = (C.NETAPP_API_CONNECTION_TIMEOUT,
+                                            C.NETAPP_API_READ_TIMEOUT)
+            # Must be set before the session below is created, which reads it
+            config.RETRY_API_BACKOFF_FACTOR = C.NETAPP_API_RETRY_API_BACKOFF_FACTOR
+            enlargeConnectionPool(connection, self.pool_maxsize)
+            connection._vm_key = key
+            config.CONNECTION = connection
         results = method(self, *args, **kwargs)
         return results
     return insertConnection
 
+def enlargeConnectionPool(connection, maxsize):
+    '''
+    Enlarge Connection Pool
+
+    Resize the connection pool of the requests session behind a HostConnection
+    so every worker polling jobs concurrently gets its own keep-alive socket
+    instead of blocking on the default 10-connection pool. The SDK mounts its
+    own adapter at the connection's origin (https://host:443); that adapter is
+    resized in place to keep its retry and logging behavior.
+    '''
+    session = getattr(connection, 'session', None)
+    if session is None:
+        return
+    adapter = session.adapters.get(connection.origin)
+    if hasattr(adapter, 'init_poolmanager'):
+        adapter.init_poolmanager(maxsize, maxsize)
+
+class SSHTimeout(socket.timeout):
+    '''SSH command timeout that carries the output read before it expired'''
+    def __init__(self, stdout, stderr):
+        super().__init__("SSH command timed out")
+        self.stdout = stdout
+        self.stderr = stderr
+
+def rest_status_code(error):
+    '''Return the HTTP status code behind a NetAppRestError, or None if unknown'''
+    status_code = getattr(error, 'status_code', None)
+    if status_code is None:
+        response = getattr(error, 'http_err_response', None)
+        status_code = getattr(response, 'status_code', None)
+    return status_code
+
 class VolumeMove:
     """Class to handle NetApp volume move operations"""
 
@@ -82,9 +150,66 @@ class VolumeMove:
         self.username = username
         self.password = password
         self.verify_ssl = verify_ssl
+        self.pool_maxsize = C.DEFAULT_MAX_CONCURRENT + 1  # REST sockets: one per tracking worker plus the reporter
+        self.vserver = f"{cluster}-ns"  # SVM that owns the volumes, built once for every CLI command
         self.active_moves = {}  # Track active moves: {vol_name: job_id}
         self.move_results = {}  # Store results: {vol_name: success/failure}
-        self.progress_lock = threading.Lock()  # Lock for thread-safe updates
+        self._status_cache = {}  # Recent job statuses: {job_id: (fetched_at, state, percent_complete)}
+        self._status_cache_lock = threading.Lock()
+
+        # One persistent SSH session per cluster; every 'volume move start' opens a
+        # channel on it instead of paying TCP/kex/auth for a new connection
+        self._ssh = paramiko.SSHClient()
+        self._ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        self._ssh_lock = threading.Lock()  # Serializes (re)connects of the shared SSH client
+        self._ssh_client()
+
+    def _ssh_client(self):
+        """Return the persistent SSH client, reconnecting if the session has dropped"""
+        with self._ssh_lock:
+            transport = self._ssh.get_transport()
+            if transport is None or not transport.is_active():
+                logger.info(f"Connecting to {self.cluster} as {self.username}")
+                self._ssh.connect(
+                    self.cluster,
+                    username=self.username,
+                    password=self.password,
+                    timeout=C.SSH_CONNECT_TIMEOUT,
+                    allow_agent=False,
+                    look_for_keys=False
+                )
+        return self._ssh
+
+    def _run_ssh(self, command=None, script=None, timeout=C.SSH_COMMAND_TIMEOUT):
+        """Run a CLI command, or feed a multi-line script to the cluster shell over stdin
+
+        Returns (exit_code, stdout, stderr). On timeout raises SSHTimeout with
+        the output read so far.
+        """
+        channel = self._ssh_client().get_transport().open_session()
+        stdout, stderr = bytearray(), bytearray()
+        try:
+            channel.settimeout(timeout)
+            if script is None:
+                channel.exec_command(command)
+            else:
+                channel.invoke_shell()
+                channel.sendall(script.encode())
+                channel.shutdown_write()
+            try:
+                for chunk in iter(lambda: channel.recv(65536), b''):
+                    stdout += chunk
+                for chunk in iter(lambda: channel.recv_stderr(65536), b''):
+                    stderr += chunk
+            except socket.timeout:
+                raise SSHTimeout(stdout.decode(errors='replace'), stderr.decode(errors='replace'))
+            return channel.recv_exit_status(), stdout.decode(errors='replace'), stderr.decode(errors='replace')
+        finally:
+            channel.close()
+
+    def close(self):
+        """Close the persistent SSH session"""
+        self._ssh.close()
 
     @connect
     def _check_volume_exists(self, volume_name):
@@ -162,108 +287,242 @@ class VolumeMove:
             logger.error(f"Error getting aggregates for node {node_name}: {str(e)}")
             return None
 
+    def _volume_move_start_args(self, volume_name, dest_aggr, cutover_action, cutover_window):
+        """Build the NetApp CLI arguments for a single 'volume move start'"""
+        return [
+            "volume", "move", "start",
+            "-vserver", self.vserver,
+            "-volume", volume_name,
+            "-destination-aggregate", dest_aggr,
+            "-cutover-action", cutover_action,
+            "-cutover-window", str(cutover_window)
+        ]
+
+    def _parse_job_id(self, output):
+        """Extract the job ID from 'volume move start' output, or None if absent"""
+        job_match = JOB_ID_RE.search(output)
+        return job_match.group(1) if job_match else None
+
     @connect
     def initiate_volume_move_cli(self, volume_name, dest_aggr, cutover_action="retry", cutover_window=30):
-        """Initiate volume move operation using sshpass with environment variable"""
+        """Initiate volume move operation over the persistent SSH session"""
         try:
-            logger.info(f"Connecting to {self.cluster} as {self.username}")
-
-            # Build the SSH command with individual NetApp CLI arguments
-            ssh_cmd = [
-                "sshpass", "-e",  # Read password from SSHPASS environment variable
-                "ssh",
-                "-o", "StrictHostKeyChecking=no",
-                "-o", "UserKnownHostsFile=/dev/null",
-                "-o", "ConnectTimeout=30",
-                f"{self.username}@{self.cluster}",
-                "volume", "move", "start",
-                "-vserver", f"{self.cluster}-ns",
-                "-volume", volume_name,
-                "-destination-aggregate", dest_aggr,
-                "-cutover-action", cutover_action,
-                "-cutover-window", str(cutover_window)
-            ]
-
-            logger.debug(f"Executing SSH command for volume {volume_name}")
-            logger.debug(f"Full command: {' '.join(ssh_cmd)}")
-
-            # Set up environment with password
-            env = os.environ.copy()
-            env['SSHPASS'] = self.password
-
-            # Execute command - Python 3.6 compatible version
-            result = subprocess.run(
-                ssh_cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                universal_newlines=True,  # Use universal_newlines instead of text for Python 3.6
-                timeout=120,  # 2 minute timeout
-                env=env
-            )
+            # Build the NetApp CLI command with individual arguments
+            cli_cmd = " ".join(self._volume_move_start_args(
+                volume_name, dest_aggr, cutover_action, cutover_window))
 
-            logger.debug(f"Command exit code: {result.returncode}")
-            logger.debug(f"Command stdout: {result.stdout}")
+            logger.debug("Executing SSH command for volume %s", volume_name)
+            logger.debug("Full command: %s", cli_cmd)
 
-            if result.stderr:
-                logger.debug(f"Command stderr: {result.stderr}")
+            returncode, stdout, stderr = self._run_ssh(command=cli_cmd)
 
-            if result.returncode != 0:
-                logger.error(f"Command failed with exit code {result.returncode}")
-                logger.error(f"Error output: {result.stderr}")
+            logger.debug("Command exit code: %s", returncode)
+            logger.debug("Command stdout: %s", stdout)
+
+            if stderr:
+                logger.debug("Command stderr: %s", stderr)
+
+            if returncode != 0:
+                logger.error(f"Command failed with exit code {returncode}")
+                logger.error(f"Error output: {stderr}")
 
                 # Check for common error patterns and provide helpful messages
-                if "not found" in result.stderr.lower():
+                if "not found" in stderr.lower():
                     logger.error("The volume or aggregate may not exist, or the command syntax is incorrect")
-                elif "permission" in result.stderr.lower():
+                elif "permission" in stderr.lower():
                     logger.error("Permission denied - check username and password")
-                elif "vserver" in result.stderr.lower():
-                    logger.error(f"VServer '{self.cluster}-ns' may not exist or be accessible")
+                elif "vserver" in stderr.lower():
+                    logger.error(f"VServer '{self.vserver}' may not exist or be accessible")
 
-                return False, result.stderr
+                return False, stderr
 
             # Parse output to get job ID
-            if "Job ID:" in result.stdout:
-                job_id = result.stdout.split("Job ID:")[1].strip().split()[0]
+            job_id = self._parse_job_id(stdout)
+            if job_id:
                 logger.info(f"Volume move started successfully, Job ID: {job_id}")
                 return True, job_id
-            elif "job-id" in result.stdout.lower():
-                # Alternative job ID format
-                import re
-                job_match = re.search(r'job-id\s+(\d+)', result.stdout, re.IGNORECASE)
-                if job_match:
-                    job_id = job_match.group(1)
-                    logger.info(f"Volume move started successfully, Job ID: {job_id}")
-                    return True, job_id
+            # Look for other success indicators
+            if any(word in stdout.lower() for word in ["started", "initiated", "begin", "moving"]):
+                logger.info(f"Volume move appears to have started successfully")
+                logger.debug("Full output: %s", stdout)
             else:
-                # Look for other success indicators
-                if any(word in result.stdout.lower() for word in ["started", "initiated", "begin", "moving"]):
-                    logger.info(f"Volume move appears to have started successfully")
-                    logger.debug(f"Full output: {result.stdout}")
-                    return True, "CLI_JOB"
-                else:
-                    logger.warning(f"Could not parse job ID from output: {result.stdout}")
-                    return True, "CLI_JOB"  # Assume success if no error
+                logger.warning(f"Could not parse job ID from output: {stdout}")
+            return True, C.UNKNOWN_JOB_ID  # Assume success if no error
 
-        except subprocess.TimeoutExpired:
+        except socket.timeout:
             logger.error(f"SSH command timed out for volume {volume_name}")
             return False, "SSH command timed out"
-        except FileNotFoundError:
-            logger.error("sshpass command not found. Please install sshpass:")
-            logger.error("  - On Ubuntu/Debian: sudo apt-get install sshpass")
-            logger.error("  - On CentOS/RHEL: sudo yum install sshpass")
-            logger.error("  - On macOS: brew install hudochenkov/sshpass/sshpass")
-            return False, "sshpass not installed"
+        except paramiko.AuthenticationException:
+            logger.error("Permission denied - check username and password")
+            return False, "SSH authentication failed"
         except Exception as e:
             logger.exception(f"SSH error when moving volume {volume_name}")
             return False, str(e)
 
+    def _match_batch_output(self, volume_names, stdout, stderr):
+        """Map batched 'volume move start' output lines to the volumes they belong to
+
+        ONTAP names the volume in both its queued and error messages
+        ('[Job 11] Job is queued: Move "vol1" ...', 'Error: ... Volume "vol1" ...').
+        A stdout line that names no volume is credited to the command the shell
+        echoed last; stderr lines are only matched by name. Returns
+        {volume_name: (success, job_id_or_error)} for the volumes that could be
+        matched.
+        """
+        patterns = {
+            volume: re.compile(r'(?:"|-volume\s+)' + re.escape(volume) + r'(?:"|\s|$)')
+            for volume in volume_names
+        }
+        results = {}
+        for stream, text in (("stdout", stdout), ("stderr", stderr)):
+            current = None  # Volume of the last echoed 'volume move start' command
+            for line in text.splitlines():
+                line = line.strip()
+                matches = [volume for volume, pattern in patterns.items() if pattern.search(line)]
+                job_id = self._parse_job_id(line)
+                if job_id is None and not CLI_ERROR_RE.search(line):
+                    if "volume move start" in line and len(matches) == 1:
+                        current = matches[0]
+                    continue
+                if len(matches) == 1:
+                    volume = matches[0]
+                elif stream == "stdout" and current is not None:
+                    volume = current
+                else:
+                    continue
+                if volume not in results:
+                    results[volume] = (True, job_id) if job_id else (False, line)
+        return results
+
+    @connect
+    def initiate_volume_move_batch(self, volume_names, dest_aggr, cutover_action="retry", cutover_window=30):
+        """Initiate several volume moves through a single SSH session
+
+        The 'volume move start' commands are piped to the cluster shell over
+        stdin so they run back-to-back on one connection. Returns a dict of
+        {volume_name: (success, job_id_or_error)}.
+        """
+        volume_names = list(volume_names)
+        if len(volume_names) == 1:
+            volume = volume_names[0]
+            return {volume: self.initiate_volume_move_cli(volume, dest_aggr, cutover_action, cutover_window)}
+
+        stdout = stderr = ""
+        try:
+            logger.info(f"Starting {len(volume_names)} volume moves on {self.cluster} in one SSH session")
+
+            commands = "\n".join(
+                " ".join(self._volume_move_start_args(volume, dest_aggr, cutover_action, cutover_window))
+                for volume in volume_names
+            ) + "\n"
+            logger.debug("Batched commands:\n%s", commands)
+
+            returncode, stdout, stderr = self._run_ssh(
+                script=commands,
+                timeout=C.SSH_COMMAND_TIMEOUT + 10 * len(volume_names)  # Allow extra time per batched command
+            )
+
+            logger.debug("Command exit code: %s", returncode)
+            logger.debug("Command stdout: %s", stdout)
+            if stderr:
+                logger.debug("Command stderr: %s", stderr)
+
+        except socket.timeout as e:
+            # Commands sent before the timeout may already have run; use what was read
+            logger.error(f"Batched SSH command timed out for volumes: {', '.join(volume_names)}")
+            stdout, stderr = getattr(e, 'stdout', ""), getattr(e, 'stderr', "")
+        except paramiko.AuthenticationException:
+            # Raised while connecting, before any command reached the cluster
+            logger.error("Permission denied - check username and password")
+            return {volume: (False, "SSH authentication failed") for volume in volume_names}
+        except Exception as e:
+            logger.exception(f"SSH error when starting batched volume moves")
+
+        # Attribute each job ID or error line to its volume by name; output
+        # is not paired by position since a command may print to stderr or nothing
+        results = self._match_batch_output(volume_names, stdout, stderr)
+        for volume, (success, result) in results.items():
+            if success:
+                logger.info(f"Volume move for {volume} started successfully, Job ID: {result}")
+            else:
+                logger.error(f"Failed to start move for volume {volume}: {result}")
+
+        # A command without a recognised result may still have started its move;
+        # ask the cluster instead of starting it again or writing it off
+        for volume in volume_names:
+            if volume not in results:
+                logger.warning(f"Could not match batched output to volume {volume}, checking the cluster")
+                results[volume] = self._lookup_volume_move(volume)
+
+        return results
+
+    @connect
+    def _get_volume_movement(self, volume_name):
+        """Return (state, percent_complete) of a volume's latest move
+
+        Returns (None, 0) if the volume has never been moved and ("error", 0)
+        if the lookup failed.
+        """
+        try:
+            volumes = list(Volume.get_collection(
+                name=volume_name,
+                fields="movement.state,movement.percent_complete",
+                **{"svm.name": self.vserver}
+            ))
+            movement = getattr(volumes[0], 'movement', None) if volumes else None
+            state = getattr(movement, 'state', None)
+            if state is None:
+                return None, 0
+            return state, getattr(movement, 'percent_complete', 0)
+        except NetAppRestError as e:
+            logger.error(f"API Error getting move state for volume {volume_name}: {str(e)}")
+            return "error", 0
+        except Exception as e:
+            logger.error(f"Error getting move state for volume {volume_name}: {str(e)}")
+            return "error", 0
+
+    def _lookup_volume_move(self, volume_name):
+        """Check on the cluster whether a batched 'volume move start' took effect
+
+        Returns (success, job_id_or_error) like initiate_volume_move_cli. A move
+        that is running is tracked by volume since its job ID is unknown.
+        """
+        state, _ = self._get_volume_movement(volume_name)
+        if state is None or state in ("success", "failed", "aborted"):
+            # Nothing running; a finished move is an earlier one, not this start
+            logger.error(f"No running volume move found for {volume_name} after batched start")
+            return False, "No running volume move found after batched start"
+        if state == "error":
+            logger.warning(f"Could not confirm batched start for {volume_name}, tracking it by volume")
+        else:
+            logger.info(f"Volume move for {volume_name} is running on the cluster (state: {state})")
+        return True, C.UNKNOWN_JOB_ID
+
     @connect
-    def get_move_status(self, volume_name, job_id):
-        """Get status of volume move operation"""
+    def get_move_status(self, volume_name, job_id, use_cache=True):
+        """Get status of volume move operation
+
+        With use_cache, a status another thread fetched moments ago for the
+        same job is reused. The job's own poller passes use_cache=False so its
+        backoff always sees fresh progress.
+        """
+        if job_id == C.UNKNOWN_JOB_ID:
+            # No job ID was reported; follow the volume's own move state instead
+            state, percent_complete = self._get_volume_movement(volume_name)
+            if state is None:
+                logger.error(f"No volume move found for {volume_name}")
+                return "error", 0
+            return ("failed" if state == "aborted" else state), percent_complete
+
+        if use_cache:
+            with self._status_cache_lock:
+                cached = self._status_cache.get(job_id)
+            if cached and time.time() - cached[0] < C.MOVE_STATUS_CACHE_TTL:
+                return cached[1], cached[2]
+
         try:
             # Get job details
-            job = Job(job_id)
-            job.get()
+            job = self._get_job(volume_name, job_id)
 
             # Extract job state and progress
             state = job.state
@@ -276,7 +535,10 @@ class VolumeMove:
 
             # Log detailed job info at debug level
             if hasattr(job, 'message'):
-                logger.debug(f"Job message for {volume_name}: {job.message}")
+                logger.debug("Job message for %s: %s", volume_name, job.message)
+
+            with self._status_cache_lock:
+                self._status_cache[job_id] = (time.time(), state, percent_complete)
 
             return state, percent_complete
         except NetAppRestError as e:
@@ -286,6 +548,23 @@ class VolumeMove:
             logger.error(f"Error getting status for volume {volume_name} (job {job_id}): {str(e)}")
             return "error", 0
 
+    @connect
+    def _get_job(self, volume_name, job_id):
+        """Fetch a job, backing off exponentially while the cluster reports overload (429/503)"""
+        for attempt in range(1, C.REST_THROTTLE_RETRIES + 1):
+            job = Job(job_id)
+            try:
+                job.get()
+                return job
+            except NetAppRestError as e:
+                status_code = rest_status_code(e)
+                if status_code not in C.REST_THROTTLE_STATUS_CODES or attempt == C.REST_THROTTLE_RETRIES:
+                    raise
+                delay = min(2 ** attempt, C.REST_THROTTLE_MAX_BACKOFF)
+                logger.warning(f"Cluster busy (HTTP {status_code}) getting status for volume {volume_name}, "
+                               f"retrying in {delay}s ({attempt}/{C.REST_THROTTLE_RETRIES})")
+                time.sleep(delay)
+
     @connect
     def wait_for_move_completion(self, volume_name, job_id, timeout=86400):  # Default 24h timeout
         """Wait for volume move to complete with timeout"""
@@ -293,35 +572,54 @@ class VolumeMove:
         last_percent = -1
         last_log_time = 0
         log_interval = 300  # Log status every 5 minutes even if no progress
+        poll_interval = C.MOVE_POLL_MIN_INTERVAL
 
         while time.time() - start_time < timeout:
             current_time = time.time()
-            state, percent_complete = self.get_move_status(volume_name, job_id)
+            state, percent_complete = self.get_move_status(volume_name, job_id, use_cache=False)
+            progressed = percent_complete != last_percent
 
             # Log if percentage changed or if log_interval has passed
             time_since_last_log = current_time - last_log_time
-            if percent_complete != last_percent or time_since_last_log >= log_interval:
-                with self.progress_lock:
-                    logger.info(f"Volume {volume_name}: {percent_complete}% complete (State: {state})")
+            if progressed or time_since_last_log >= log_interval:
+                logger.info(f"Volume {volume_name}: {percent_complete}% complete (State: {state})")
                 last_percent = percent_complete
                 last_log_time = current_time
 
             if state.lower() in ["success", "complete", "completed"]:
-                with self.progress_lock:
-                    logger.info(f"Volume move for {volume_name} completed successfully")
+                logger.info(f"Volume move for {volume_name} completed successfully")
                 return True
 
             if state.lower() in ["failure", "error", "failed"]:
-                with self.progress_lock:
-                    logger.error(f"Volume move for {volume_name} failed")
+                logger.error(f"Volume move for {volume_name} failed")
                 return False
 
-            time.sleep(30)  # Check status every 30 seconds
+            # Poll quickly while the job is moving, back off exponentially while it stalls
+            if progressed:
+                poll_interval = C.MOVE_POLL_MIN_INTERVAL
+            else:
+                poll_interval = min(poll_interval * 2, C.MOVE_POLL_MAX_INTERVAL)
+            remaining = timeout - (time.time() - start_time)
+            time.sleep(max(0, min(poll_interval, remaining)))
 
-        with self.progress_lock:
-            logger.error(f"Volume move for {volume_name} timed out after {timeout/3600:.1f} hours")
+        logger.error(f"Volume move for {volume_name} timed out after {timeout/3600:.1f} hours")
         return False
 
+    @connect
+    def track_volume_move(self, volume_name, job_id, timeout=86400):
+        """Wait for an already started volume move and record its result"""
+        # Single dict operations are atomic under the GIL, so no lock here
+        self.active_moves[volume_name] = job_id
+
+        move_success = self.wait_for_move_completion(volume_name, job_id, timeout)
+
+        self.active_moves.pop(volume_name, None)
+        self.move_results[volume_name] = move_success
+        with self._status_cache_lock:
+            self._status_cache.pop(job_id, None)
+
+        return move_success
+
     @connect
     def process_volume_move(self, volume_name, dest_aggr, cutover_action="retry", cutover_window=30, timeout=86400):
         """Process a single volume move operation"""
@@ -334,24 +632,46 @@ class VolumeMove:
             logger.error(f"Failed to initiate move for volume {volume_name}: {result}")
             return False
 
-        job_id = result
-        with self.progress_lock:
-            self.active_moves[volume_name] = job_id
-
-        move_success = self.wait_for_move_completion(volume_name, job_id, timeout)
-
-        with self.progress_lock:
-            if volume_name in self.active_moves:
-                del self.active_moves[volume_name]
-            self.move_results[volume_name] = move_success
-
-        return move_success
+        return self.track_volume_move(volume_name, result, timeout)
+
+    def _start_volume_moves(self, executor, volumes, dest_aggr, cutover_action, cutover_window, timeout):
+        """Batch-start volume moves and submit a completion tracker for each one started
+
+        Returns ({volume_name: future}, [volumes that failed to start]).
+        """
+        started = {}
+        failed = []
+        results = self.initiate_volume_move_batch(volumes, dest_aggr, cutover_action, cutover_window)
+        for volume in volumes:
+            success, result = results[volume]
+            if not success:
+                self.move_results[volume] = False
+                logger.error(f"Failed to initiate move for volume {volume}: {result}")
+                failed.append(volume)
+                continue
+            self.active_moves[volume] = result
+            started[volume] = executor.submit(self.track_volume_move, volume, result, timeout)
+        return started, failed
 
     @connect
-    def process_volume_list(self, volume_list, dest_aggr, max_concurrent=4, cutover_action="retry",
+    def process_volume_list(self, volume_list, dest_aggr, max_concurrent=None, cutover_action="retry",
                         cutover_window=30, timeout=86400, ignore_health_check=False):
-        """Process a list of volumes with a limit on concurrent operations"""
-        total_volumes = len(volume_list)
+        """Process a list of volumes with a limit on concurrent operations
+
+        volume_list may be any iterable, including a generator streaming volume
+        names from a file; volumes are read only as slots free up.
+        """
+        # Total is unknown until a streamed input has been fully consumed
+        total_volumes = len(volume_list) if hasattr(volume_list, '__len__') else None
+        total_label = total_volumes if total_volumes is not None else "?"
+        if max_concurrent is None:
+            max_concurrent = C.DEFAULT_MAX_CONCURRENT
+            if total_volumes is not None:
+                max_concurrent = max(1, min(max_concurrent, total_volumes))
+        if max_concurrent + 1 > self.pool_maxsize:
+            # The decorator already connected with the default pool; grow it for this run
+            self.pool_maxsize = max_concurrent + 1
+            enlargeConnectionPool(config.CONNECTION, self.pool_maxsize)
         completed = 0
         success_count = 0
         failed_volumes = []
@@ -362,38 +682,52 @@ class VolumeMove:
             logger.error("Use --ignore-health-check to bypass this check.")
             return False
 
-        logger.info(f"Starting migration of {total_volumes} volumes to aggregate {dest_aggr}")
+        logger.info(f"Starting migration of {total_label} volumes to aggregate {dest_aggr}")
         start_time = datetime.now()
 
         # Track in-progress moves for status updates
         in_progress = {}  # {volume_name: future}
         completed_volumes = []
 
-        with ThreadPoolExecutor(max_workers=max_concurrent) as executor:
-            # Submit initial batch up to max_concurrent
-            for i, volume in enumerate(volume_list[:max_concurrent]):
-                future = executor.submit(
-                    self.process_volume_move,
-                    volume,
-                    dest_aggr,
-                    cutover_action,
-                    cutover_window
-                )
-                in_progress[volume] = future
-                logger.info(f"Started migration for volume {volume} ({i+1}/{total_volumes})")
-
-            # Process remaining volumes as others complete
-            remaining_volumes = volume_list[max_concurrent:]
+        # Volumes waiting to start, consumed lazily in input order
+        remaining_volumes = iter(volume_list)
+        volumes_exhausted = False
 
+        # Workers only track already started jobs; starts and status reports run on this thread
+        with ThreadPoolExecutor(max_workers=max_concurrent) as executor:
             # Track and report progress
             last_status_time = time.time()
             status_interval = 60  # Status update every 60 seconds
 
-            while in_progress:
+            while True:
+                # Fill free slots up to max_concurrent; all starts in a round share one SSH session
+                while not volumes_exhausted and len(in_progress) < max_concurrent:
+                    free_slots = max_concurrent - len(in_progress)
+                    batch = list(itertools.islice(remaining_volumes, free_slots))
+                    if not batch:
+                        volumes_exhausted = True
+                        break
+
+                    started, failed = self._start_volume_moves(
+                        executor, batch, dest_aggr, cutover_action, cutover_window, timeout)
+                    for vol in failed:
+                        failed_volumes.append(vol)
+                        completed_volumes.append(vol)
+                        logger.error(f"[FAILED] Volume {vol} migration failed")
+                    for vol, future in started.items():
+                        in_progress[vol] = future
+                        logger.info(f"Started migration for volume {vol} ({len(completed_volumes)+len(in_progress)}/{total_label})")
+
+                if not in_progress:
+                    break
+
+                # Block until a move finishes or the next status update is due
+                wait_timeout = max(0, status_interval - (time.time() - last_status_time))
+                done, _ = wait(in_progress.values(), timeout=wait_timeout, return_when=FIRST_COMPLETED)
+
                 # Check for completed moves
-                completed_now = []
                 for vol, future in list(in_progress.items()):
-                    if future.done():
+                    if future in done:
                         # Process result
                         success = future.result()
                         if success:
@@ -406,50 +740,39 @@ class VolumeMove:
                         # Remove from in progress and add to completed
                         del in_progress[vol]
                         completed_volumes.append(vol)
-                        completed_now.append(vol)
-
-                # Submit new volumes for any completed moves (if any remain)
-                for _ in completed_now:
-                    if remaining_volumes:
-                        next_vol = remaining_volumes.pop(0)
-                        future = executor.submit(
-                            self.process_volume_move,
-                            next_vol,
-                            dest_aggr,
-                            cutover_action,
-                            cutover_window
-                        )
-                        in_progress[next_vol] = future
-                        logger.info(f"Started migration for volume {next_vol} ({len(completed_volumes)+len(in_progress)}/{total_volumes})")
 
                 # Periodic status update of in-progress moves
                 current_time = time.time()
-                if current_time - last_status_time > status_interval:
-                    with self.progress_lock:
-                        logger.info(f"--- Current Status ---")
-                        logger.info(f"Total volumes: {total_volumes}")
-                        logger.info(f"Completed: {len(completed_volumes)}/{total_volumes}")
-                        logger.info(f"In progress: {len(in_progress)}/{total_volumes}")
-                        logger.info(f"Waiting to start: {len(remaining_volumes)}/{total_volumes}")
-                        logger.info(f"Success so far: {success_count}")
-                        logger.info(f"Failed so far: {len(failed_volumes)}")
-
-                        # Show current progress of in-progress moves
-                        if in_progress:
-                            logger.info("Currently moving:")
-                            for vol in in_progress.keys():
-                                if vol in self.active_moves:
-                                    job_id = self.active_moves[vol]
-                                    state, percent = self.get_move_status(vol, job_id)
-                                    logger.info(f"  - {vol}: {percent}% complete (State: {state})")
+                if current_time - last_status_time >= status_interval:
+                    # Workers add and remove entries without a lock; copying a plain
+                    # dict is a single C call and atomic under the GIL
+                    active_moves = self.active_moves.copy()
+
+                    logger.info(f"--- Current Status ---")
+                    if total_volumes is not None:
+                        waiting = total_volumes - len(completed_volumes) - len(in_progress)
+                    else:
+                        waiting = "?"
+                    logger.info(f"Total volumes: {total_label}")
+                    logger.info(f"Completed: {len(completed_volumes)}/{total_label}")
+                    logger.info(f"In progress: {len(in_progress)}/{total_label}")
+                    logger.info(f"Waiting to start: {waiting}/{total_label}")
+                    logger.info(f"Success so far: {success_count}")
+                    logger.info(f"Failed so far: {len(failed_volumes)}")
+
+                    # Show current progress of in-progress moves
+                    if in_progress:
+                        logger.info("Currently moving:")
+                        for vol in in_progress.keys():
+                            if vol in active_moves:
+                                state, percent = self.get_move_status(vol, active_moves[vol])
+                                logger.info(f"  - {vol}: {percent}% complete (State: {state})")
 
                     last_status_time = current_time
 
-                # Short sleep to prevent CPU spinning
-                time.sleep(1)
-
         end_time = datetime.now()
         duration = end_time - start_time
+        total_volumes = len(completed_volumes)
 
         # Final report
         logger.info("=" * 70)
@@ -479,13 +802,29 @@ class VolumeMove:
         return success_count == total_volumes
 
 def read_volume_list(file_path):
-    """Read volume list from file (one volume per line)"""
+    """Yield volume names from file (one volume per line) as they are read"""
     try:
         with open(file_path, 'r') as f:
-            return [line.strip() for line in f if line.strip()]
+            for line in f:
+                if line.strip():
+                    yield line.strip()
     except Exception as e:
         logger.error(f"Error reading volume list from {file_path}: {str(e)}")
-        return []
+
+def unique_volumes(volumes):
+    """Yield each volume name once, keeping the input order"""
+    seen = set()
+    for volume in volumes:
+        if volume not in seen:
+            seen.add(volume)
+            yield volume
+
+def positive_int(value):
+    """argparse type for integer options that must be at least 1"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
 
 def main():
     """Main function to parse arguments and execute volume moves"""
@@ -496,7 +835,8 @@ def main():
     parser.add_argument('--dest-aggr', required=True, help='Destination aggregate name')
     parser.add_argument('--volume-list', help='Path to file containing list of volumes to move')
     parser.add_argument('--volume', action='append', help='Volume to move (can be specified multiple times)')
-    parser.add_argument('--max-concurrent', type=int, default=4, help='Maximum concurrent volume moves (default: 4)')
+    parser.add_argument('--max-concurrent', type=positive_int,
+                       help=f'Maximum concurrent volume moves, at least 1 (default: {C.DEFAULT_MAX_CONCURRENT})')
     parser.add_argument('--cutover-action', default='retry', choices=['retry', 'defer', 'abort', 'force'],
                        help='Action to take if cutover is delayed')
     parser.add_argument('--cutover-window', type=int, default=30,
@@ -515,33 +855,38 @@ def main():
     # Configure logging level
     logger.setLevel(getattr(logging, args.log_level))
 
-    # Get list of volumes to move
-    volumes = []
+    # Get volumes to move; a volume list file is streamed rather than loaded up front
+    sources = []
     if args.volume_list:
-        volumes.extend(read_volume_list(args.volume_list))
+        sources.append(read_volume_list(args.volume_list))
     if args.volume:
-        volumes.extend(args.volume)
+        sources.append(args.volume)
+
+    # Remove duplicates, keeping the input order
+    volumes = unique_volumes(itertools.chain.from_iterable(sources))
 
-    if not volumes:
+    first_volume = next(volumes, None)
+    if first_volume is None:
         logger.error("No volumes specified for migration")
         parser.print_help()
         sys.exit(1)
+    volumes = itertools.chain([first_volume], volumes)
 
-    # Remove duplicates
-    volumes = list(set(volumes))
+    max_concurrent = args.max_concurrent or C.DEFAULT_MAX_CONCURRENT
 
-    logger.info(f"Preparing to move {len(volumes)} volumes to aggregate {args.dest_aggr}")
+    logger.info(f"Preparing to move volumes to aggregate {args.dest_aggr}")
 
     # Display configuration
     logger.info(f"Configuration:")
     logger.info(f"  - Cluster: {args.cluster}")
     logger.info(f"  - Destination aggregate: {args.dest_aggr}")
-    logger.info(f"  - Max concurrent moves: {args.max_concurrent}")
+    logger.info(f"  - Max concurrent moves: {max_concurrent}")
     logger.info(f"  - Cutover action: {args.cutover_action}")
     logger.info(f"  - Cutover window: {args.cutover_window} seconds")
     logger.info(f"  - Timeout: {args.timeout} seconds")
 
     # Instantiate volume move handler
+    mover = None
     try:
         mover = VolumeMove(
             cluster=args.cluster,
@@ -554,7 +899,7 @@ def main():
         success = mover.process_volume_list(
             volume_list=volumes,
             dest_aggr=args.dest_aggr,
-            max_concurrent=args.max_concurrent,
+            max_concurrent=max_concurrent,
             cutover_action=args.cutover_action,
             cutover_window=args.cutover_window,
             timeout=args.timeout,
@@ -568,6 +913,9 @@ def main():
     except Exception as e:
         logger.critical(f"Fatal error: {str(e)}")
         sys.exit(1)
+    finally:
+        if mover is not None:
+            mover.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
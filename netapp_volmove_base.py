@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+NetApp Volume Move Script - Shared Logic
+Configuration, orchestration and move-limit bookkeeping shared by the REST API
+and Python SDK versions; each version only implements the cluster transport
+"""
+
+import time
+import json
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+class BaseMover(ABC):
+    """Base class for the volume movers
+
+    Subclasses implement connect_netapp(), list_moves(), get_volume(),
+    has_active_move() and post_move(); they may override prefetch() and
+    wait_for_source_moves_below() with faster transport-specific versions.
+    """
+    title = "NetApp Volume Move Script"
+
+    def __init__(self):
+        self.cluster_name = None
+        self.source_aggr = None
+        self.dest_aggr = None
+        self.volume_list = None
+        self.moves_cache = None  # (counter, multi_counter, fetched_at) from the last get_vol_moves
+        self.volume_infos = None  # Volume name -> volume info, filled by prefetch()
+        self.moving_volumes = None  # Names of volumes with a move, filled by prefetch()
+
+    def read_config_files(self):
+        """Read configuration from config.json, or from the legacy text files
+
+        config.json holds {"cluster", "source_aggr", "dest_aggr", "volumes": [...]}
+        and replaces Cluster.txt, SAggr.txt, DAggr.txt and Vol.txt.
+        """
+        config_path = Path('config.json')
+        if config_path.exists():
+            try:
+                config = json.loads(config_path.read_bytes())
+                self.cluster_name = config['cluster'].strip()
+                self.source_aggr = config['source_aggr'].strip()
+                self.dest_aggr = config['dest_aggr'].strip()
+                if not isinstance(config['volumes'], list):
+                    # A bare string would otherwise be iterated as one-letter volumes
+                    raise TypeError("'volumes' must be a list of volume names")
+                self.volume_list = [vol.strip() for vol in config['volumes'] if vol.strip()]
+            except (ValueError, KeyError, TypeError, AttributeError) as e:
+                print(f"Invalid configuration file {config_path}: {e}")
+                raise
+            return
+
+        try:
+            with open('Cluster.txt', 'r') as f:
+                self.cluster_name = f.read().strip()
+
+            with open('SAggr.txt', 'r') as f:
+                self.source_aggr = f.read().strip()
+
+            with open('DAggr.txt', 'r') as f:
+                self.dest_aggr = f.read().strip()
+
+            with open('Vol.txt', 'r') as f:
+                self.volume_list = [line.strip() for line in f.readlines() if line.strip()]
+
+        except FileNotFoundError as e:
+            print(f"Configuration file not found: {e}")
+            raise
+
+    @abstractmethod
+    def connect_netapp(self):
+        """Establish connection to NetApp cluster"""
+
+    @abstractmethod
+    def list_moves(self):
+        """Print in-flight moves and return (counter, multi_counter), or None on error"""
+
+    @abstractmethod
+    def get_volume(self, volume_name):
+        """Look up a single volume on the cluster, or return None"""
+
+    @abstractmethod
+    def has_active_move(self, volume_name):
+        """Ask the cluster whether a volume already has a move"""
+
+    @abstractmethod
+    def post_move(self, volume_info):
+        """Start a move for a volume and return True if the cluster accepted it"""
+
+    def prefetch(self):
+        """Fill volume_infos and moving_volumes in bulk; without it lookups go per volume"""
+
+    def wait_for_source_moves_below(self, limit):
+        """Wait for a source-aggregate move to finish (fixed 1 minute by default)"""
+        time.sleep(60)
+
+    def get_vol_moves(self, max_age=5):
+        """Get current volume moves and return counters
+
+        Counters fetched within the last max_age seconds are reused; the cache
+        is invalidated whenever a move is started or the caller has waited.
+        """
+        if self.moves_cache and time.time() - self.moves_cache[2] < max_age:
+            return self.moves_cache[0], self.moves_cache[1]
+
+        counters = self.list_moves()
+        if counters is None:
+            return 0, 0
+        self.moves_cache = (counters[0], counters[1], time.time())
+        return counters
+
+    def get_volume_info(self, volume_name):
+        """Get volume information including SVM"""
+        if self.volume_infos is not None:
+            return self.volume_infos.get(volume_name)
+        return self.get_volume(volume_name)
+
+    def check_existing_vol_move(self, volume_name):
+        """Check if volume already has an active move"""
+        if self.moving_volumes is not None:
+            return volume_name in self.moving_volumes
+        return self.has_active_move(volume_name)
+
+    def start_volume_move(self, vol_name, volume_info):
+        """Start a volume move and update the cached move state"""
+        if self.post_move(volume_info):
+            self.moves_cache = None
+            if self.moving_volumes is not None:
+                self.moving_volumes.add(vol_name)
+
+    def run(self):
+        """Main execution function"""
+        print(f"Starting {self.title}")
+
+        # Read configuration
+        self.read_config_files()
+        print(f"Cluster: {self.cluster_name}")
+        print(f"Source Aggregate: {self.source_aggr}")
+        print(f"Destination Aggregate: {self.dest_aggr}")
+        print(f"Volumes to move: {len(self.volume_list)}")
+
+        # Connect to NetApp
+        self.connect_netapp()
+
+        # Resolve all volumes and existing moves up front
+        self.prefetch()
+
+        # Find the volumes that can be moved
+        ready = []
+        for vol_name in self.volume_list:
+            print(f"\nProcessing volume: {vol_name}")
+
+            # Get volume information
+            volume_info = self.get_volume_info(vol_name)
+            if not volume_info:
+                print(f"Volume {vol_name} not found, skipping...")
+                continue
+
+            # Check if volume already has an active move
+            if self.check_existing_vol_move(vol_name):
+                print(f"Volume {vol_name} already has an active move, skipping...")
+                continue
+
+            ready.append((vol_name, volume_info))
+
+        # Submit moves one at a time in input order; each start depends on the
+        # move counts left by the previous one
+        for item in ready:
+            self.submit_one(item)
+
+    def submit_one(self, item):
+        """Start a move for one (vol_name, volume_info) once the move limits allow it"""
+        vol_name, volume_info = item
+        while True:
+            # Re-check; a duplicate entry may have just been started
+            if self.check_existing_vol_move(vol_name):
+                print(f"Volume {vol_name} already has an active move, skipping...")
+                return
+
+            # Get current volume move status
+            counter, multi_counter = self.get_vol_moves()
+
+            if multi_counter < 2:
+                # Start volume move if conditions are met
+                if counter < 2:
+                    print(f"Vol move counter is = {counter}")
+                    self.start_volume_move(vol_name, volume_info)
+                else:
+                    print(f"Skipping {vol_name} - too many active moves (counter: {counter}, multi_counter: {multi_counter})")
+                return
+
+            # Wait if too many concurrent moves from source aggregate
+            current_time = time.strftime("%H:%M:%S")
+            print(f"{current_time} - Vol move counter is greater than 2, waiting up to 1 min for a move to finish...")
+            self.wait_for_source_moves_below(2)
+            self.moves_cache = None
@@ -7,43 +7,72 @@ Translates PowerShell volume move script to Python using direct REST API calls
 import time
 import getpass
 import requests
-import json
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from urllib3.exceptions import InsecureRequestWarning
+from urllib3.util.retry import Retry
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from netapp_volmove_base import BaseMover
+
+try:
+    import httpx  # Optional: HTTP/2 multiplexing when installed as httpx[http2]
+except ImportError:
+    httpx = None
+
+try:
+    import orjson  # Optional: faster parsing of large collection responses
+except ImportError:
+    orjson = None
 
 # Suppress SSL warnings for demo purposes
 requests.packages.urllib3.disable_warnings(category=InsecureRequestWarning)
 
-class NetAppVolumeMoverREST:
+if httpx is not None:
+    class StatusRetryTransport(httpx.HTTPTransport):
+        """HTTP transport that also retries GETs on 429/5xx responses
+
+        httpx's own retries only cover connection errors; this restores the
+        status retry that the requests session gets from urllib3's Retry.
+        """
+        def __init__(self, status_retries=3, backoff_factor=0.3,
+                     status_forcelist=(429, 500, 502, 503, 504), **kwargs):
+            super().__init__(**kwargs)
+            self.status_retries = status_retries
+            self.backoff_factor = backoff_factor
+            self.status_forcelist = status_forcelist
+
+        def handle_request(self, request):
+            for attempt in range(self.status_retries + 1):
+                response = super().handle_request(request)
+                # Like urllib3, never retry a POST the cluster may already have accepted
+                if (request.method not in ('GET', 'HEAD')
+                        or response.status_code not in self.status_forcelist
+                        or attempt == self.status_retries):
+                    return response
+                response.close()
+                time.sleep(self.backoff_factor * (2 ** attempt))
+
+def parse_json(response):
+    """Decode a JSON response body, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+class NetAppVolumeMoverREST(BaseMover):
+    title = "NetApp Volume Move Script (REST API)"
+
     def __init__(self):
-        self.cluster_name = None
+        super().__init__()
         self.base_url = None
         self.auth = None
         self.session = None
-        self.source_aggr = None
-        self.dest_aggr = None
-        self.volume_list = None
+        self.aggr_uuid_cache = {}  # Aggregate name -> UUID; aggregates don't change during a run
+        self.dest_aggr_ref = None  # Destination aggregate part of the move request, built once
         
     def read_config_files(self):
-        """Read configuration from text files"""
-        try:
-            with open('Cluster.txt', 'r') as f:
-                self.cluster_name = f.read().strip()
-                self.base_url = f"https://{self.cluster_name}/api"
-            
-            with open('SAggr.txt', 'r') as f:
-                self.source_aggr = f.read().strip()
-                
-            with open('DAggr.txt', 'r') as f:
-                self.dest_aggr = f.read().strip()
-                
-            with open('Vol.txt', 'r') as f:
-                self.volume_list = [line.strip() for line in f.readlines() if line.strip()]
-                
-        except FileNotFoundError as e:
-            print(f"Configuration file not found: {e}")
-            raise
+        """Read configuration and derive the REST base URL from the cluster name"""
+        super().read_config_files()
+        self.base_url = f"https://{self.cluster_name}/api"
             
     def connect_netapp(self):
         """Establish connection to NetApp cluster"""
@@ -51,9 +80,25 @@ class NetAppVolumeMoverREST:
         password = getpass.getpass("Enter NetApp password: ")
         
         self.auth = HTTPBasicAuth(username, password)
-        self.session = requests.Session()
-        self.session.auth = self.auth
-        self.session.verify = False  # Set to True in production with proper certificates
+        self.session = self.create_http2_session(username, password)
+        if self.session is None:
+            self.session = requests.Session()
+            self.session.auth = self.auth
+            self.session.verify = False  # Set to True in production with proper certificates
+            
+            # Reuse keep-alive connections to the cluster instead of a TLS handshake per call
+            adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=32,
+                max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+            )
+            self.session.mount('https://', adapter)
+            self.session.mount('http://', adapter)
+            self.session.headers.update({
+                'Connection': 'keep-alive',
+                'Content-Type': 'application/json',
+                'Accept': 'application/json'
+            })
         
         # Test connection
         try:
@@ -66,51 +111,149 @@ class NetAppVolumeMoverREST:
             print(f"Failed to connect to NetApp cluster: {e}")
             raise
             
-    def get_vol_moves(self):
+    def create_http2_session(self, username, password):
+        """Create an HTTP/2 client that multiplexes all calls over one TLS connection
+
+        Returns None when httpx[http2] is not installed, in which case the
+        requests session is used. The httpx client exposes the same get/post
+        and response API that the rest of this class relies on, and is given
+        the requests session's timeout and retry behavior.
+        """
+        if httpx is None:
+            return None
+        try:
+            transport = StatusRetryTransport(http2=True, verify=False, retries=3)
+        except ImportError:
+            # httpx is installed without the h2 package
+            return None
+        print("Using HTTP/2 for NetApp REST calls")
+        return httpx.Client(
+            transport=transport,
+            auth=(username, password),
+            verify=False,  # Set to True in production with proper certificates
+            timeout=httpx.Timeout(None),  # No timeout, like the requests session; httpx defaults to 5s
+            headers={'Content-Type': 'application/json', 'Accept': 'application/json'}
+        )
+            
+    def list_moves(self):
         """Get current volume moves and return counters"""
         try:
-            # Get all volume moves
-            response = self.session.get(f"{self.base_url}/storage/volume-moves")
+            # Get healthy (in-flight) volume moves with their details inline, rather
+            # than one GET per move; the cluster filters out finished moves
+            response = self.session.get(
+                f"{self.base_url}/storage/volume-moves",
+                params={'state': 'healthy',
+                        'fields': 'source_aggregate.name,destination_aggregate.name,'
+                                  'volume.name,percent_complete'}
+            )
             
             if response.status_code != 200:
                 print(f"Error getting volume moves: {response.status_code}")
-                return 0, 0
+                return None
                 
-            vol_moves_data = response.json()
+            vol_moves_data = parse_json(response)
             counter = 0
             multi_counter = 0
             
             for vol_move in vol_moves_data.get('records', []):
-                if vol_move.get('state') == 'healthy':
-                    counter += 1
-                    
-                    # Get detailed information for each volume move
-                    vol_move_detail_response = self.session.get(
-                        f"{self.base_url}/storage/volume-moves/{vol_move['uuid']}"
-                    )
-                    
-                    if vol_move_detail_response.status_code == 200:
-                        vol_move_detail = vol_move_detail_response.json()
-                        
-                        # Check if source aggregate matches our source
-                        source_aggr_name = vol_move_detail.get('source_aggregate', {}).get('name', '')
-                        if source_aggr_name == self.source_aggr:
-                            multi_counter += 1
-                        
-                        volume_name = vol_move_detail.get('volume', {}).get('name', 'Unknown')
-                        dest_aggr_name = vol_move_detail.get('destination_aggregate', {}).get('name', 'Unknown')
-                        percent_complete = vol_move_detail.get('percent_complete', 0)
-                        
-                        print(f"{volume_name} is still moving to {dest_aggr_name} "
-                              f"- Percent Complete = {percent_complete}%")
+                counter += 1
+                
+                # Check if source aggregate matches our source
+                source_aggr_name = vol_move.get('source_aggregate', {}).get('name', '')
+                if source_aggr_name == self.source_aggr:
+                    multi_counter += 1
+                
+                volume_name = vol_move.get('volume', {}).get('name', 'Unknown')
+                dest_aggr_name = vol_move.get('destination_aggregate', {}).get('name', 'Unknown')
+                percent_complete = vol_move.get('percent_complete', 0)
+                
+                print(f"{volume_name} is still moving to {dest_aggr_name} "
+                      f"- Percent Complete = {percent_complete}%")
                     
             return counter, multi_counter
             
         except Exception as e:
             print(f"Error getting volume moves: {e}")
-            return 0, 0
+            return None
+            
+    def prefetch(self, chunk_size=100, max_workers=8):
+        """Look up every listed volume and all existing moves in a few bulk requests
+
+        The requests are independent, so they are issued concurrently over the
+        session's connection pool; total latency is roughly the slowest request
+        rather than the sum of all of them.
+        """
+        try:
+            # ONTAP treats '|' as OR; chunk the names to keep the query string bounded
+            chunks = [self.volume_list[i:i + chunk_size]
+                      for i in range(0, len(self.volume_list), chunk_size)]
             
-    def get_volume_info(self, volume_name):
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                moves_future = executor.submit(
+                    self.session.get,
+                    f"{self.base_url}/storage/volume-moves",
+                    params={'fields': 'volume.name,state,source_aggregate.name'}
+                )
+                volume_futures = [
+                    executor.submit(
+                        self.session.get,
+                        f"{self.base_url}/storage/volumes",
+                        params={'name': '|'.join(names), 'fields': 'svm,name,uuid'}
+                    )
+                    for names in chunks
+                ]
+                volume_responses = [future.result() for future in volume_futures]
+                response = moves_future.result()
+            
+            volume_infos = {}
+            for volume_response in volume_responses:
+                if volume_response.status_code != 200:
+                    print(f"Error prefetching volume info: {volume_response.status_code}")
+                    return
+                for record in parse_json(volume_response).get('records', []):
+                    volume_infos.setdefault(record['name'], record)
+            
+            if response.status_code != 200:
+                print(f"Error prefetching volume moves: {response.status_code}")
+                return
+            moving_volumes = {
+                vol_move.get('volume', {}).get('name')
+                for vol_move in parse_json(response).get('records', [])
+            }
+            
+            self.volume_infos = volume_infos
+            self.moving_volumes = moving_volumes
+            print(f"Prefetched {len(volume_infos)} volumes and {len(moving_volumes)} existing moves")
+            
+        except Exception as e:
+            # Fall back to per-volume lookups
+            print(f"Error prefetching volume data: {e}")
+            
+    def wait_for_source_moves_below(self, limit, max_wait=60, poll_interval=10):
+        """Wait until fewer than `limit` moves are running from the source aggregate
+
+        Polls a count-only query, so the caller resumes within poll_interval of a
+        move finishing instead of always sleeping the full max_wait.
+        """
+        deadline = time.time() + max_wait
+        while True:
+            try:
+                response = self.session.get(
+                    f"{self.base_url}/storage/volume-moves",
+                    params={'state': 'healthy', 'source_aggregate.name': self.source_aggr,
+                            'return_records': 'false'}
+                )
+                if response.status_code == 200 and parse_json(response).get('num_records', 0) < limit:
+                    return
+            except Exception as e:
+                print(f"Error polling volume moves: {e}")
+                
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return
+            time.sleep(min(poll_interval, remaining))
+            
+    def get_volume(self, volume_name):
         """Get volume information including SVM"""
         try:
             response = self.session.get(
@@ -119,7 +262,7 @@ class NetAppVolumeMoverREST:
             )
             
             if response.status_code == 200:
-                volumes_data = response.json()
+                volumes_data = parse_json(response)
                 if volumes_data.get('records'):
                     return volumes_data['records'][0]
             
@@ -127,29 +270,27 @@ class NetAppVolumeMoverREST:
             print(f"Error getting volume info for {volume_name}: {e}")
         return None
         
-    def check_existing_vol_move(self, volume_name):
+    def has_active_move(self, volume_name):
         """Check if volume already has an active move"""
         try:
-            response = self.session.get(f"{self.base_url}/storage/volume-moves")
+            # Let the cluster match the volume name and return only the count
+            response = self.session.get(
+                f"{self.base_url}/storage/volume-moves",
+                params={'volume.name': volume_name, 'return_records': 'false'}
+            )
             
             if response.status_code == 200:
-                vol_moves_data = response.json()
-                for vol_move in vol_moves_data.get('records', []):
-                    # Get detailed information
-                    detail_response = self.session.get(
-                        f"{self.base_url}/storage/volume-moves/{vol_move['uuid']}"
-                    )
-                    if detail_response.status_code == 200:
-                        detail = detail_response.json()
-                        if detail.get('volume', {}).get('name') == volume_name:
-                            return True
+                return parse_json(response).get('num_records', 0) > 0
                             
         except Exception as e:
             print(f"Error checking existing volume move: {e}")
         return False
         
     def get_aggregate_uuid(self, aggr_name):
-        """Get aggregate UUID by name"""
+        """Get aggregate UUID by name (cached after the first successful lookup)"""
+        if aggr_name in self.aggr_uuid_cache:
+            return self.aggr_uuid_cache[aggr_name]
+            
         try:
             response = self.session.get(
                 f"{self.base_url}/storage/aggregates",
@@ -157,28 +298,30 @@ class NetAppVolumeMoverREST:
             )
             
             if response.status_code == 200:
-                aggr_data = response.json()
+                aggr_data = parse_json(response)
                 if aggr_data.get('records'):
-                    return aggr_data['records'][0]['uuid']
+                    aggr_uuid = aggr_data['records'][0]['uuid']
+                    self.aggr_uuid_cache[aggr_name] = aggr_uuid
+                    return aggr_uuid
                     
         except Exception as e:
             print(f"Error getting aggregate UUID for {aggr_name}: {e}")
         return None
         
-    def start_volume_move(self, volume_info):
+    def post_move(self, volume_info):
         """Start a volume move"""
         try:
-            # Get destination aggregate UUID
-            dest_aggr_uuid = self.get_aggregate_uuid(self.dest_aggr)
-            if not dest_aggr_uuid:
-                print(f"Could not find destination aggregate: {self.dest_aggr}")
-                return
+            # Resolve the destination aggregate once; only the first volume pays for the lookup
+            if self.dest_aggr_ref is None:
+                dest_aggr_uuid = self.get_aggregate_uuid(self.dest_aggr)
+                if not dest_aggr_uuid:
+                    print(f"Could not find destination aggregate: {self.dest_aggr}")
+                    return False
+                self.dest_aggr_ref = {"uuid": dest_aggr_uuid}
                 
-            # Prepare volume move request
+            # Prepare volume move request; Content-Type is set on the session
             vol_move_data = {
-                "destination_aggregate": {
-                    "uuid": dest_aggr_uuid
-                },
+                "destination_aggregate": self.dest_aggr_ref,
                 "volume": {
                     "uuid": volume_info["uuid"]
                 }
@@ -186,64 +329,18 @@ class NetAppVolumeMoverREST:
             
             response = self.session.post(
                 f"{self.base_url}/storage/volume-moves",
-                json=vol_move_data,
-                headers={'Content-Type': 'application/json'}
+                json=vol_move_data
             )
             
             if response.status_code in [201, 202]:
                 print(f"{volume_info['name']} is now moving")
-            else:
-                print(f"Error starting volume move for {volume_info['name']}: "
-                      f"Status {response.status_code}, Response: {response.text}")
+                return True
+            print(f"Error starting volume move for {volume_info['name']}: "
+                  f"Status {response.status_code}, Response: {response.text}")
                 
         except Exception as e:
             print(f"Error starting volume move for {volume_info['name']}: {e}")
-            
-    def run(self):
-        """Main execution function"""
-        print("Starting NetApp Volume Move Script (REST API)")
-        
-        # Read configuration
-        self.read_config_files()
-        print(f"Cluster: {self.cluster_name}")
-        print(f"Source Aggregate: {self.source_aggr}")
-        print(f"Destination Aggregate: {self.dest_aggr}")
-        print(f"Volumes to move: {len(self.volume_list)}")
-        
-        # Connect to NetApp
-        self.connect_netapp()
-        
-        # Process each volume
-        for vol_name in self.volume_list:
-            print(f"\nProcessing volume: {vol_name}")
-            
-            # Get volume information
-            volume_info = self.get_volume_info(vol_name)
-            if not volume_info:
-                print(f"Volume {vol_name} not found, skipping...")
-                continue
-                
-            # Check if volume already has an active move
-            if self.check_existing_vol_move(vol_name):
-                print(f"Volume {vol_name} already has an active move, skipping...")
-                continue
-                
-            # Get current volume move status
-            counter, multi_counter = self.get_vol_moves()
-            
-            # Wait if too many concurrent moves from source aggregate
-            while multi_counter >= 2:
-                current_time = datetime.now().strftime("%H:%M:%S")
-                print(f"{current_time} - Vol move counter is greater than 2, sleeping 1 min...")
-                time.sleep(60)
-                counter, multi_counter = self.get_vol_moves()
-                
-            # Start volume move if conditions are met
-            if counter < 2 and multi_counter < 2:
-                print(f"Vol move counter is = {counter}")
-                self.start_volume_move(volume_info)
-            else:
-                print(f"Skipping {vol_name} - too many active moves (counter: {counter}, multi_counter: {multi_counter})")
+        return False
 
 if __name__ == "__main__":
     try:
@@ -4,39 +4,16 @@ NetApp Volume Move Script - Python SDK Version
 Translates PowerShell volume move script to Python using NetApp ONTAP SDK
 """
 
-import time
 import getpass
-from datetime import datetime
-from netapp_ontap import NetAppRestError
+from netapp_ontap import config, NetAppRestError
 from netapp_ontap.config import HostConnection
 from netapp_ontap.resources import Volume, VolMove, Aggregate, Svm
+from netapp_volmove_base import BaseMover
 
-class NetAppVolumeMover:
+class NetAppVolumeMover(BaseMover):
     def __init__(self):
-        self.cluster_name = None
+        super().__init__()
         self.connection = None
-        self.source_aggr = None 
-        self.dest_aggr = None
-        self.volume_list = None
-        
-    def read_config_files(self):
-        """Read configuration from text files"""
-        try:
-            with open('Cluster.txt', 'r') as f:
-                self.cluster_name = f.read().strip()
-            
-            with open('SAggr.txt', 'r') as f:
-                self.source_aggr = f.read().strip()
-                
-            with open('DAggr.txt', 'r') as f:
-                self.dest_aggr = f.read().strip()
-                
-            with open('Vol.txt', 'r') as f:
-                self.volume_list = [line.strip() for line in f.readlines() if line.strip()]
-                
-        except FileNotFoundError as e:
-            print(f"Configuration file not found: {e}")
-            raise
             
     def connect_netapp(self):
         """Establish connection to NetApp cluster"""
@@ -50,11 +27,14 @@ class NetAppVolumeMover:
                 password=password,
                 verify=False  # Set to True in production with proper certificates
             )
+            # Make it the SDK's global connection so every resource call below
+            # reuses this connection and its keep-alive session
+            config.CONNECTION = self.connection
         except Exception as e:
             print(f"Failed to connect to NetApp cluster: {e}")
             raise
             
-    def get_vol_moves(self):
+    def list_moves(self):
         """Get current volume moves and return counters"""
         try:
             # Get all active volume moves
@@ -78,89 +58,44 @@ class NetAppVolumeMover:
             
         except NetAppRestError as e:
             print(f"Error getting volume moves: {e}")
-            return 0, 0
+            return None
             
-    def start_volume_move(self, volume_name, vserver_name):
+    def post_move(self, volume_info):
         """Start a volume move"""
         try:
             # Create volume move job
             vol_move = VolMove()
-            vol_move.volume = {"name": volume_name, "svm": {"name": vserver_name}}
+            vol_move.volume = {"name": volume_info.name, "svm": {"name": volume_info.svm.name}}
             vol_move.destination_aggregate = {"name": self.dest_aggr}
             
             vol_move.post()
-            print(f"{volume_name} is now moving")
+            print(f"{volume_info.name} is now moving")
+            return True
             
         except NetAppRestError as e:
-            print(f"Error starting volume move for {volume_name}: {e}")
+            print(f"Error starting volume move for {volume_info.name}: {e}")
+        return False
             
-    def get_volume_info(self, volume_name):
+    def get_volume(self, volume_name):
         """Get volume information including vserver"""
         try:
-            volumes = Volume.get_collection(name=volume_name)
-            for volume in volumes:
-                volume.get()  # Populate all fields
-                return volume
+            # Request the needed fields with the lookup instead of a second GET per volume
+            volumes = Volume.get_collection(name=volume_name, fields="svm.name,uuid,name", max_records=1)
+            return next(iter(volumes), None)
         except NetAppRestError as e:
             print(f"Error getting volume info for {volume_name}: {e}")
         return None
         
-    def check_existing_vol_move(self, volume_name):
+    def has_active_move(self, volume_name):
         """Check if volume already has an active move"""
         try:
-            vol_moves = VolMove.get_collection()
+            vol_moves = VolMove.get_collection(fields="volume.name,state,source_aggregate.name")
             for vol_move in vol_moves:
                 if vol_move.volume.name == volume_name:
                     return True
         except NetAppRestError as e:
             print(f"Error checking existing volume move: {e}")
         return False
-        
-    def run(self):
-        """Main execution function"""
-        print("Starting NetApp Volume Move Script")
-        
-        # Read configuration
-        self.read_config_files()
-        print(f"Cluster: {self.cluster_name}")
-        print(f"Source Aggregate: {self.source_aggr}")
-        print(f"Destination Aggregate: {self.dest_aggr}")
-        print(f"Volumes to move: {len(self.volume_list)}")
-        
-        # Connect to NetApp
-        self.connect_netapp()
-        
-        # Process each volume
-        for vol_name in self.volume_list:
-            print(f"\nProcessing volume: {vol_name}")
-            
-            # Get volume information
-            volume_info = self.get_volume_info(vol_name)
-            if not volume_info:
-                print(f"Volume {vol_name} not found, skipping...")
-                continue
-                
-            # Check if volume already has an active move
-            if self.check_existing_vol_move(vol_name):
-                print(f"Volume {vol_name} already has an active move, skipping...")
-                continue
-                
-            # Get current volume move status
-            counter, multi_counter = self.get_vol_moves()
-            
-            # Wait if too many concurrent moves from source aggregate
-            while multi_counter >= 2:
-                current_time = datetime.now().strftime("%H:%M:%S")
-                print(f"{current_time} - Vol move counter is greater than 2, sleeping 1 min...")
-                time.sleep(60)
-                counter, multi_counter = self.get_vol_moves()
-                
-            # Start volume move if conditions are met
-            if counter < 2 and multi_counter < 2:
-                print(f"Vol move counter is = {counter}")
-                self.start_volume_move(vol_name, volume_info.svm.name)
-            else:
-                print(f"Skipping {vol_name} - too many active moves (counter: {counter}, multi_counter: {multi_counter})")
 
 if __name__ == "__main__":
     try:
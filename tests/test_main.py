@@ -0,0 +1,107 @@
+"""Tests for main.py"""
+
+import unittest
+from unittest import mock
+
+import main
+
+
+class InitiateVolumeMoveBatchTest(unittest.TestCase):
+    """Batched 'volume move start' output is attributed to volumes by name"""
+
+    def setUp(self):
+        patches = [
+            mock.patch.object(main.VolumeMove, '_ssh_client'),
+            mock.patch.object(main, 'HostConnection'),
+            mock.patch.object(main, 'config'),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.mover = main.VolumeMove("c1", "admin", "secret")
+
+    def command(self, volume):
+        return "c1::> " + " ".join(self.mover._volume_move_start_args(volume, "aggr2", "retry", 30))
+
+    def queued(self, job_id, volume):
+        return (f'[Job {job_id}] Job is queued: Move "{volume}" in Vserver "c1-ns" to aggregate "aggr2". '
+                f'Use the "volume move show -vserver c1-ns -volume {volume}" command to view the status '
+                f'of this operation.')
+
+    def test_mixed_success_and_error_output(self):
+        stdout = "\n".join([
+            self.command("a"),
+            self.queued(11, "a"),
+            self.command("b"),
+            self.command("c"),
+            self.queued(33, "c"),
+            self.command("d"),
+            "c1::> Error: command failed: Volume \"d\" in Vserver \"c1-ns\" is already being moved.",
+        ])
+        stderr = 'Error: command failed: Volume "b" in Vserver "c1-ns" does not exist.'
+
+        with mock.patch.object(self.mover, '_run_ssh', return_value=(1, stdout, stderr)), \
+                mock.patch.object(self.mover, 'initiate_volume_move_cli') as single:
+            results = self.mover.initiate_volume_move_batch(["a", "b", "c", "d"], "aggr2")
+
+        self.assertEqual(results["a"], (True, "11"))
+        self.assertFalse(results["b"][0])
+        self.assertIn('"b"', results["b"][1])
+        self.assertEqual(results["c"], (True, "33"))
+        self.assertFalse(results["d"][0])
+        self.assertIn('"d"', results["d"][1])
+        single.assert_not_called()
+
+    def test_unnamed_job_line_follows_echoed_command(self):
+        stdout = "\n".join([
+            self.command("vol1"),
+            "Job ID: 7",
+            self.command("vol10"),
+            "Job ID: 8",
+        ])
+
+        with mock.patch.object(self.mover, '_run_ssh', return_value=(0, stdout, "")):
+            results = self.mover.initiate_volume_move_batch(["vol1", "vol10"], "aggr2")
+
+        self.assertEqual(results, {"vol1": (True, "7"), "vol10": (True, "8")})
+
+    def test_unmatched_volume_is_looked_up_not_restarted(self):
+        stdout = "\n".join([self.queued(11, "a"), "Job ID: 12"])
+        stderr = "Error: command failed: permission denied"
+
+        with mock.patch.object(self.mover, '_run_ssh', return_value=(1, stdout, stderr)), \
+                mock.patch.object(self.mover, '_get_volume_movement',
+                                  return_value=("replicating", 5)) as movement, \
+                mock.patch.object(self.mover, 'initiate_volume_move_cli') as single:
+            results = self.mover.initiate_volume_move_batch(["a", "b"], "aggr2")
+
+        self.assertEqual(results, {"a": (True, "11"), "b": (True, main.C.UNKNOWN_JOB_ID)})
+        movement.assert_called_once_with("b")
+        single.assert_not_called()
+
+    def test_unmatched_volume_without_running_move_fails(self):
+        stdout = self.queued(11, "a")
+
+        with mock.patch.object(self.mover, '_run_ssh', return_value=(0, stdout, "")), \
+                mock.patch.object(self.mover, '_get_volume_movement', return_value=(None, 0)):
+            results = self.mover.initiate_volume_move_batch(["a", "b"], "aggr2")
+
+        self.assertEqual(results["a"], (True, "11"))
+        self.assertFalse(results["b"][0])
+
+    def test_timeout_keeps_output_read_before_it(self):
+        stdout = "\n".join([self.command("a"), self.queued(11, "a"), self.command("b")])
+        timeout = main.SSHTimeout(stdout, "")
+
+        with mock.patch.object(self.mover, '_run_ssh', side_effect=timeout), \
+                mock.patch.object(self.mover, '_get_volume_movement',
+                                  side_effect=[("queued", 0), (None, 0)]) as movement:
+            results = self.mover.initiate_volume_move_batch(["a", "b", "c"], "aggr2")
+
+        self.assertEqual(results["a"], (True, "11"))
+        self.assertEqual(results["b"], (True, main.C.UNKNOWN_JOB_ID))
+        self.assertFalse(results["c"][0])
+        self.assertEqual(movement.call_args_list, [mock.call("b"), mock.call("c")])
+
+if __name__ == "__main__":
+    unittest.main()